@@ -4,13 +4,31 @@ __version__ = "1.0.6"
 __author__ = "Jassem Manita"
 __description__ = "Smart pip requirements installer"
 
-from .checker import check_installed_packages
-from .core import main
-from .discovery import auto_discover_requirements
-from .installer import install_packages
-from .logger import setup_logging
-from .parser import parse_package_name, read_requirements
-from .uninstaller import check_packages_to_uninstall, uninstall_packages
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .checker import check_installed_packages
+    from .core import main
+    from .discovery import auto_discover_requirements
+    from .installer import install_packages
+    from .logger import setup_logging
+    from .parser import parse_package_name, read_requirements
+    from .uninstaller import check_packages_to_uninstall, uninstall_packages
+
+# Public names are resolved on first access so that importing midna (as
+# the console script does) does not load every submodule up front.
+_EXPORTS = {
+    "main": ".core",
+    "install_packages": ".installer",
+    "uninstall_packages": ".uninstaller",
+    "check_packages_to_uninstall": ".uninstaller",
+    "read_requirements": ".parser",
+    "parse_package_name": ".parser",
+    "check_installed_packages": ".checker",
+    "setup_logging": ".logger",
+    "auto_discover_requirements": ".discovery",
+}
 
 __all__ = [
     "main",
@@ -23,3 +41,11 @@ __all__ = [
     "setup_logging",
     "auto_discover_requirements",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import and return the public names listed in ``_EXPORTS``."""
+    if name in _EXPORTS:
+        module = importlib.import_module(_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,10 +1,129 @@
 """Package installation checker for Midna"""
 
+import functools
 import logging
-import subprocess
-from typing import List, Set, Tuple
+import os
+import site
+import sys
+import threading
+from typing import AbstractSet, Dict, List, Tuple
 
-from .parser import parse_package_name
+from .parser import normalize_package_name, parse_package_name
+
+logger = logging.getLogger("midna")
+
+# Serializes scans so a caller arriving during the first (uncached) scan
+# waits for it instead of starting a second one
+_SCAN_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=4)
+def _site_dirs(path: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Find the directories that hold installed distributions.
+
+    Only site directories count: the script directory or working
+    directory on ``sys.path`` changes whenever a file is written there
+    (e.g. ``--output``), which says nothing about installed packages.
+
+    Args:
+        path: Snapshot of ``sys.path``, part of the cache key
+
+    Returns:
+        Existing site-packages directories, plus any other path entries
+        that contain distribution metadata
+    """
+    candidates = list(getattr(site, "getsitepackages", list)())
+    if site.ENABLE_USER_SITE:
+        candidates.append(site.getusersitepackages())
+    for entry in path:
+        try:
+            with os.scandir(entry or ".") as entries:
+                if any(
+                    e.name.endswith((".dist-info", ".egg-info"))
+                    for e in entries
+                ):
+                    candidates.append(entry)
+        except OSError:
+            continue
+    return tuple(
+        d for d in dict.fromkeys(candidates) if d and os.path.isdir(d)
+    )
+
+
+def _site_stamp() -> float:
+    """Return the newest modification time among the site directories.
+
+    Installing or removing a distribution touches its site directory, so
+    the stamp changes whenever the installed set may have changed.
+    """
+    stamp = 0.0
+    for entry in _site_dirs(tuple(sys.path)):
+        try:
+            stamp = max(stamp, os.stat(entry).st_mtime)
+        except OSError:
+            continue
+    return stamp
+
+
+@functools.lru_cache(maxsize=4)
+def _installed_versions(prefix: str, stamp: float) -> Dict[str, str]:
+    """Scan installed distributions for one environment state.
+
+    Args:
+        prefix: Environment prefix (``sys.prefix``), part of the cache key
+        stamp: Site directory stamp from ``_site_stamp``, part of the key
+
+    Returns:
+        Dict of normalized installed distribution name to version; it is
+        shared between callers and must not be modified
+    """
+    # Imported on first use; importlib.metadata pulls in zipfile and email
+    import importlib.metadata
+
+    versions: Dict[str, str] = {}
+    for dist in importlib.metadata.distributions():
+        name = dist.metadata["Name"]
+        if name:
+            # First match on sys.path wins, as with distribution(name)
+            versions.setdefault(
+                sys.intern(normalize_package_name(name)), dist.version
+            )
+    return versions
+
+
+def _current_versions() -> Dict[str, str]:
+    """Get the cached scan for the current environment state.
+
+    Returns:
+        Dict of normalized installed distribution name to version
+    """
+    with _SCAN_LOCK:
+        return _installed_versions(sys.prefix, _site_stamp())
+
+
+def get_installed_packages() -> AbstractSet[str]:
+    """Get the normalized names of all installed distributions.
+
+    The scan is cached until the site directories change.
+
+    Returns:
+        Set of normalized installed distribution names
+    """
+    return _current_versions().keys()
+
+
+def get_installed_version(package_name: str) -> str:
+    """Get the installed version of a distribution.
+
+    Uses the same cached scan as ``get_installed_packages``.
+
+    Args:
+        package_name: Distribution name, in any PEP 503 spelling
+
+    Returns:
+        Version string if installed, empty string otherwise
+    """
+    return _current_versions().get(normalize_package_name(package_name), "")
 
 
 def check_installed_packages(
@@ -17,52 +136,35 @@ def check_installed_packages(
 
     Returns:
         Tuple of two lists: (missing_packages, already_installed)
-
-    Raises:
-        subprocess.CalledProcessError: If pip list command fails
     """
-    logger = logging.getLogger("midna")
+    if not packages:
+        return [], []
+
     logger.info("Checking installed packages...")
 
-    try:
-        # Get list of installed packages
-        result = subprocess.run(
-            ["pip", "list", "--format=freeze"],
-            capture_output=True,
-            text=True,
-            check=True,
-            shell=False,
-        )
+    installed_packages = get_installed_packages()
+    logger.debug("Found %d installed packages", len(installed_packages))
 
-        installed_raw = (
-            result.stdout.strip().split("\n") if result.stdout.strip() else []
+    # Parse and normalize each query name once, outside the membership tests
+    normalized = [
+        (
+            package,
+            sys.intern(normalize_package_name(parse_package_name(package))),
         )
-        installed_packages: Set[str] = set()
-
-        for package in installed_raw:
-            if "==" in package:
-                name = package.split("==")[0].lower()
-                installed_packages.add(name)
-
-        logger.debug(f"Found {len(installed_packages)} installed packages")
-
-    except subprocess.CalledProcessError as e:
-        logger.error(f"Failed to get installed packages: {e}")
-        print("ERROR: Failed to check installed packages")
-        raise
-
-    missing_packages = []
-    already_installed = []
-
-    for package in packages:
-        package_name = parse_package_name(package).lower()
-
-        if package_name in installed_packages:
-            already_installed.append(package)
-            logger.debug(f"Already installed: {package}")
-        else:
-            missing_packages.append(package)
-            logger.debug(f"Missing: {package}")
+        for package in packages
+    ]
+    missing_packages = [
+        pkg for pkg, name in normalized if name not in installed_packages
+    ]
+    already_installed = [
+        pkg for pkg, name in normalized if name in installed_packages
+    ]
+
+    if logger.isEnabledFor(logging.DEBUG):
+        for package in already_installed:
+            logger.debug("Already installed: %s", package)
+        for package in missing_packages:
+            logger.debug("Missing: %s", package)
 
     logger.info(
         f"Missing packages: {len(missing_packages)}, "
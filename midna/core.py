@@ -1,18 +1,33 @@
 """Main CLI interface for Midna"""
 
-import importlib.metadata
+import logging
+import os
 import sys
-from argparse import ArgumentParser, RawDescriptionHelpFormatter
+from argparse import ArgumentParser, Namespace, RawDescriptionHelpFormatter
+from typing import List, Optional, Tuple
 
-from .discovery import auto_discover_requirements, extract_imports_from_file
-from .checker import check_installed_packages
-from .installer import install_packages
 from .logger import setup_logging
-from .parser import read_requirements
-from .uninstaller import check_packages_to_uninstall, uninstall_packages
+
+# The checker, installer, uninstaller and discovery modules (and the heavy
+# stdlib modules they pull in) are imported on first use so that --help,
+# --version and argument errors stay fast.
+
+_PARSER: Optional[ArgumentParser] = None
 
 
 def create_parser() -> ArgumentParser:
+    """Get the argument parser, building it on first use.
+
+    Returns:
+        ArgumentParser: Configured argument parser with all CLI options
+    """
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    return _PARSER
+
+
+def _build_parser() -> ArgumentParser:
     """Create and configure the argument parser.
 
     Returns:
@@ -98,16 +113,170 @@ def create_parser() -> ArgumentParser:
     return parser
 
 
-def main() -> int:
+def _get_packages(args: Namespace) -> Tuple[List[str], str]:
+    """Collect packages from the given file or by auto-discovery.
+
+    Args:
+        args: Parsed command-line arguments
+
+    Returns:
+        Tuple of (packages, source_info) describing where they came from
+    """
+    logger = logging.getLogger("midna")
+
+    if args.requirements_file:
+        if args.requirements_file.endswith(".py"):
+            from .discovery import extract_imports_from_file
+
+            # Use import extraction for Python files
+            packages = list(extract_imports_from_file(args.requirements_file))
+            source_info = f"imports from: {args.requirements_file}"
+            logger.info(
+                f"Extracted imports from Python file: {args.requirements_file}"
+            )
+        else:
+            from .parser import read_requirements
+
+            # Traditional mode: use specified file
+            packages = read_requirements(args.requirements_file)
+            source_info = f"file: {args.requirements_file}"
+            logger.info(f"Using specified file: {args.requirements_file}")
+    else:
+        from .discovery import auto_discover_requirements
+
+        # Auto-discovery mode
+        print("Auto-discovering requirements...")
+        # Safe to parallelize here: the CLI entry points guard __main__
+        discovered_items = auto_discover_requirements(".", parallel=True)
+
+        # Convert list of tuples to list of package names
+        packages_info, discovery_method = discovered_items
+        packages = [pkg[0] for pkg in packages_info]
+        source_info = discovery_method
+
+        logger.info(f"Auto-discovery used: {source_info}")
+
+    return packages, source_info
+
+
+def _render_report(*sections: Tuple[str, str, List[str]]) -> str:
+    """Render titled package listings as a single block of text.
+
+    Args:
+        sections: (title, marker, packages) triples; empty ones are skipped
+
+    Returns:
+        str: Report text, one line per header and package
+    """
+    lines = []
+    for title, marker, section_packages in sections:
+        if section_packages:
+            lines.append(f"\n{title} ({len(section_packages)} packages):")
+            lines.extend(
+                f"  {marker} {package}" for package in section_packages
+            )
+    return "".join(f"{line}\n" for line in lines)
+
+
+def _write_packages(path: str, packages: List[str]) -> None:
+    """Write packages to a requirements file, one per line.
+
+    The content is encoded once and written straight to the file
+    descriptor, bypassing the text I/O layers.
+
+    Args:
+        path: Destination file path (created or truncated)
+        packages: Package specifications to write
+    """
+    payload = memoryview(("\n".join(packages) + "\n").encode("utf-8"))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        while payload:
+            payload = payload[os.write(fd, payload) :]
+    finally:
+        os.close(fd)
+
+
+def _handle_uninstall(packages: List[str], dry_run: bool) -> int:
+    """Check which packages are installed and uninstall them.
+
+    Args:
+        packages: List of package specifications to uninstall
+        dry_run: If True, only preview without uninstalling
+
+    Returns:
+        int: Exit code (0 for success, non-zero for errors)
+    """
+    from .uninstaller import (
+        _check_package_list_to_uninstall,
+        _uninstall_package_list,
+    )
+
+    # Check once and keep the parsed names for the pip command
+    found, not_found_packages = _check_package_list_to_uninstall(packages)
+    found_packages = [spec for spec, _ in found]
+
+    report = _render_report(
+        ("Not installed", "-", not_found_packages),
+        ("Will uninstall", "-", found_packages),
+    )
+    if not found_packages:
+        report += "\nNo packages to uninstall (none are installed)!\n"
+    sys.stdout.write(report)
+    sys.stdout.flush()
+    if not found_packages:
+        return 0
+
+    return _uninstall_package_list(
+        found_packages, dry_run, package_names=[name for _, name in found]
+    )
+
+
+def _handle_install(packages: List[str], dry_run: bool) -> int:
+    """Check which packages are missing and install them.
+
+    Args:
+        packages: List of package specifications to install
+        dry_run: If True, only preview without installing
+
+    Returns:
+        int: Exit code (0 for success, non-zero for errors)
+    """
+    from .checker import check_installed_packages
+    from .installer import install_packages
+
+    missing_packages, already_installed = check_installed_packages(packages)
+
+    report = _render_report(
+        ("Already installed", "+", already_installed),
+        ("Will install", "-", missing_packages),
+    )
+    if not missing_packages:
+        report += "\nAll packages are already installed!\n"
+    sys.stdout.write(report)
+    sys.stdout.flush()
+    if not missing_packages:
+        return 0
+
+    return install_packages(missing_packages, dry_run)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
     """Main entry point for Midna CLI.
 
+    Args:
+        argv: Command-line arguments, without the program name
+            (default: sys.argv[1:])
+
     Returns:
         int: Exit code (0 for success, non-zero for errors)
     """
     parser = create_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if args.version:
+        import importlib.metadata
+
         try:
             version = importlib.metadata.version("midna")
             print(f"Midna version {version}")
@@ -120,34 +289,33 @@ def main() -> int:
     if args.log:
         logger.info("Midna started")
 
-    try:
-        # Determine how to get packages
-        if args.requirements_file:
-            if args.requirements_file.endswith(".py"):
-                # Use import extraction for Python files
-                packages = list(
-                    extract_imports_from_file(args.requirements_file)
-                )
-                source_info = f"imports from: {args.requirements_file}"
-                logger.info(
-                    f"Extracted imports from Python file: {args.requirements_file}"
-                )
-            else:
-                # Traditional mode: use specified file
-                packages = read_requirements(args.requirements_file)
-                source_info = f"file: {args.requirements_file}"
-                logger.info(f"Using specified file: {args.requirements_file}")
-        else:
-            # Auto-discovery mode
-            print("Auto-discovering requirements...")
-            discovered_items = auto_discover_requirements(".")
+    from concurrent.futures import CancelledError, ThreadPoolExecutor
 
-            # Convert list of tuples to list of package names
-            packages_info, discovery_method = discovered_items
-            packages = [pkg[0] for pkg in packages_info]
-            source_info = discovery_method
+    from .checker import get_installed_packages
 
-            logger.info(f"Auto-discovery used: {source_info}")
+    # Scan installed packages in the background while discovery runs on
+    # the main thread, where Ctrl-C can still interrupt it
+    executor = ThreadPoolExecutor(max_workers=1)
+    installed_future = executor.submit(get_installed_packages)
+    executor.shutdown(wait=False)
+
+    try:
+        try:
+            packages, source_info = _get_packages(args)
+        finally:
+            # Never return with the scan still running, even when discovery
+            # fails; if the scan failed, the checker rescans and reports it
+            installed_future.cancel()
+            try:
+                installed_future.result()
+            except CancelledError:
+                pass
+            except Exception as e:
+                logger.warning(f"Background package scan failed: {e}")
+
+        # Drop duplicates from every source once, keeping first-seen order,
+        # before the checker, uninstaller and --output see the list
+        packages = list(dict.fromkeys(packages))
 
         if not packages:
             if args.requirements_file:
@@ -165,9 +333,7 @@ def main() -> int:
         # Save packages to output file if requested
         if args.output:
             try:
-                with open(args.output, "w") as f:
-                    for package in packages:
-                        f.write(f"{package}\n")
+                _write_packages(args.output, packages)
                 print(f"\nSaved discovered packages to: {args.output}")
                 logger.info(f"Saved packages to: {args.output}")
             except Exception as e:
@@ -178,82 +344,11 @@ def main() -> int:
         # Show packages that were found
         if args.verbose or not args.requirements_file:
             print("\nDiscovered packages:")
-            for package in packages:
-                print(f"  + {package}")
+            print("\n".join(f"  + {package}" for package in packages))
 
         if args.uninstall:
-            # Handle uninstall mode
-            if args.requirements_file:
-                found_packages, not_found_packages = (
-                    check_packages_to_uninstall(args.requirements_file)
-                )
-            else:
-                # For auto-discovered packages, create temp file
-                import tempfile
-
-                with tempfile.NamedTemporaryFile(
-                    mode="w", suffix=".txt", delete=False
-                ) as temp_file:
-                    temp_file.write("\n".join(packages))
-                    temp_path = temp_file.name
-
-                try:
-                    found_packages, not_found_packages = (
-                        check_packages_to_uninstall(temp_path)
-                    )
-                finally:
-                    import os
-
-                    os.unlink(temp_path)
-
-            if not_found_packages:
-                print(f"\nNot installed ({len(not_found_packages)} packages):")
-                for package in not_found_packages:
-                    print(f"  - {package}")
-            if not found_packages:
-                print("\nNo packages to uninstall (none are installed)!")
-                return 0
-            print(f"\nWill uninstall ({len(found_packages)} packages):")
-            for package in found_packages:
-                print(f"  - {package}")
-
-            # Create temp file for uninstaller
-            import tempfile
-
-            with tempfile.NamedTemporaryFile(
-                mode="w", suffix=".txt", delete=False
-            ) as temp_file:
-                temp_file.write("\n".join(found_packages))
-                temp_path = temp_file.name
-
-            try:
-                exit_code = uninstall_packages(temp_path, args.dry_run)
-            finally:
-                import os
-
-                os.unlink(temp_path)
-
-            return exit_code
-        else:
-            # Handle install mode
-            missing_packages, already_installed = check_installed_packages(
-                packages
-            )
-            if already_installed:
-                print(
-                    f"\nAlready installed ({len(already_installed)} "
-                    f"packages):"
-                )
-                for package in already_installed:
-                    print(f"  + {package}")
-            if not missing_packages:
-                print("\nAll packages are already installed!")
-                return 0
-            print(f"\nWill install ({len(missing_packages)} packages):")
-            for package in missing_packages:
-                print(f"  - {package}")
-            exit_code = install_packages(missing_packages, args.dry_run)
-            return exit_code
+            return _handle_uninstall(packages, args.dry_run)
+        return _handle_install(packages, args.dry_run)
 
     except FileNotFoundError as e:
         print(f"ERROR: {e}")
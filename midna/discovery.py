@@ -1,13 +1,156 @@
 """Auto-discovery for Midna - find requirements automatically"""
 
-import ast
 import logging
 import os
+import re
+import sys
 from pathlib import Path
-from typing import List, Set, Tuple
+from typing import (
+    TYPE_CHECKING,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from .package_classifier import classify_packages
 
+if TYPE_CHECKING:
+    import ast
+    from multiprocessing.context import BaseContext
+
+logger = logging.getLogger("midna")
+
+# Standard library modules; Python < 3.10 lacks sys.stdlib_module_names,
+# so fall back to a list of the common ones (not exhaustive)
+_STDLIB_MODULES: FrozenSet[str] = getattr(
+    sys, "stdlib_module_names", None
+) or frozenset(
+    {
+        "os",
+        "sys",
+        "json",
+        "re",
+        "math",
+        "random",
+        "datetime",
+        "time",
+        "pathlib",
+        "collections",
+        "itertools",
+        "functools",
+        "operator",
+        "typing",
+        "dataclasses",
+        "enum",
+        "abc",
+        "contextlib",
+        "logging",
+        "argparse",
+        "configparser",
+        "subprocess",
+        "shutil",
+        "tempfile",
+        "glob",
+        "fnmatch",
+        "linecache",
+        "pickle",
+        "copy",
+        "pprint",
+        "textwrap",
+        "string",
+        "io",
+        "codecs",
+        "locale",
+        "calendar",
+        "hashlib",
+        "hmac",
+        "secrets",
+        "uuid",
+        "urllib",
+        "http",
+        "email",
+        "html",
+        "xml",
+        "csv",
+        "sqlite3",
+        "zlib",
+        "gzip",
+        "bz2",
+        "lzma",
+        "zipfile",
+        "tarfile",
+        "threading",
+        "multiprocessing",
+        "concurrent",
+        "queue",
+        "socket",
+        "ssl",
+        "asyncio",
+        "unittest",
+        "doctest",
+        "trace",
+        "pdb",
+        "profile",
+        "warnings",
+        "inspect",
+        "dis",
+        "importlib",
+        "pkgutil",
+        "platform",
+        "ctypes",
+        "struct",
+        "array",
+        "weakref",
+        "gc",
+        "types",
+    }
+)
+
+# Directories that shouldn't be scanned for Python files
+_SKIP_DIRS = frozenset(
+    {
+        ".git",
+        ".svn",
+        ".hg",  # VCS
+        "__pycache__",
+        ".pytest_cache",  # Cache
+        ".venv",
+        "venv",
+        "env",  # Virtual environments
+        "node_modules",  # JS dependencies
+        ".tox",
+        ".mypy_cache",  # Tools
+        "build",
+        "dist",
+        ".eggs",  # Build artifacts
+    }
+)
+
+# Below this many files a process pool costs more than it saves
+_PARALLEL_MIN_FILES = 64
+
+# "import" as a whole word; every import statement contains one, while
+# identifiers like importlib or imported_names don't count
+_IMPORT_KEYWORD_RE = re.compile(rb"\bimport\b")
+
+# Requirements files looked for by name, in reporting order; other
+# requirements*.txt files are reported right after requirements.txt
+_REQUIREMENTS_FILE_NAMES = (
+    "requirements.txt",
+    "pyproject.toml",
+    "setup.py",
+    "Pipfile",
+    "environment.yml",
+    "conda.yml",
+)
+
+# Statement attributes that hold nested statement blocks
+_BLOCK_FIELDS = ("body", "orelse", "finalbody", "handlers", "cases")
+
 
 def find_requirements_files(directory: str = ".") -> List[str]:
     """Find requirements files in the given directory.
@@ -16,40 +159,72 @@ def find_requirements_files(directory: str = ".") -> List[str]:
         directory: Path to directory to search (default: current directory)
 
     Returns:
-        List of paths to found requirements files
+        List of paths to found requirements files: requirements.txt, other
+        requirements*.txt files, then pyproject.toml and the other formats
     """
-    logger = logging.getLogger("midna")
-
-    # Common requirements file patterns
-    patterns = [
-        "requirements.txt",
-        "requirements*.txt",
-        "pyproject.toml",
-        "setup.py",
-        "Pipfile",
-        "environment.yml",
-        "conda.yml",
-    ]
-
-    found_files = []
     dir_path = Path(directory)
 
-    # Look for requirements files
-    for pattern in patterns:
-        if "*" in pattern:
-            for file_path in dir_path.glob(pattern):
-                if file_path.is_file():
-                    found_files.append(str(file_path))
-                    logger.info(f"Found requirements file: {file_path}")
-        else:
-            file_path = dir_path / pattern
-            if file_path.exists():
-                found_files.append(str(file_path))
-                logger.info(f"Found requirements file: {file_path}")
+    # One directory listing, matched by name; requirements*.txt also
+    # matches requirements.txt, which is reported only once, first
+    extra_txt_files = []
+    named_files = set()
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name = entry.name
+                if name in _REQUIREMENTS_FILE_NAMES:
+                    if entry.is_file():
+                        named_files.add(name)
+                elif name.startswith("requirements") and name.endswith(".txt"):
+                    if entry.is_file():
+                        extra_txt_files.append(name)
+    except OSError as e:
+        logger.warning(f"Cannot list {directory}: {e}")
+        return []
+
+    ordered_names = sorted(extra_txt_files)
+    if "requirements.txt" in named_files:
+        ordered_names.insert(0, "requirements.txt")
+    ordered_names.extend(
+        name for name in _REQUIREMENTS_FILE_NAMES[1:] if name in named_files
+    )
+
+    found_files = []
+    for name in ordered_names:
+        file_path = dir_path / name
+        found_files.append(str(file_path))
+        logger.info(f"Found requirements file: {file_path}")
 
     return found_files
 
 
+def _iter_import_nodes(
+    tree: "ast.AST",
+) -> Iterator[Union["ast.Import", "ast.ImportFrom"]]:
+    """Yield the import statements of a module.
+
+    Imports are statements, so only nested statement blocks (if/try/with/
+    for/while/def/class/match bodies and handlers) are searched; the
+    expression subtrees that make up most of a module are never visited.
+
+    Args:
+        tree: Parsed module
+
+    Yields:
+        Import and ImportFrom nodes
+    """
+    import ast
+
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            yield node
+            continue
+        for field in _BLOCK_FIELDS:
+            stack.extend(getattr(node, field, ()))
+
+
 def extract_imports_from_file(file_path: str) -> Set[str]:
     """Extract import statements from a Python file.
 
@@ -59,34 +234,66 @@ def extract_imports_from_file(file_path: str) -> Set[str]:
     Returns:
         Set of imported top-level package names
     """
-    logger = logging.getLogger("midna")
+    imports, warning = _scan_imports(file_path)
+    if warning:
+        logger.warning(warning)
+    return imports
+
+
+def _scan_imports(file_path: str) -> Tuple[Set[str], Optional[str]]:
+    """Extract imports from a file, returning any warning instead of logging.
+
+    Process-pool workers don't have the CLI's log handlers, so warnings
+    are handed back for the parent process to log.
+
+    Args:
+        file_path: Path to the Python file to analyze
+
+    Returns:
+        Tuple of (imported top-level package names, warning or None)
+    """
+    # Imported here so CLI runs that never analyze code don't pay for it
+    import ast
+
     imports: Set[str] = set()
 
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            try:
-                tree = ast.parse(f.read())
-            except SyntaxError as e:
-                logger.warning(f"Syntax error in {file_path}: {e}")
-                return imports
-
-        for node in ast.walk(tree):
+        with open(file_path, "rb") as f:
+            source = f.read()
+
+        # Files without the keyword can't import anything; skip parsing.
+        # The substring test is cheap and rejects most such files before
+        # the word-boundary search rules out names like importlib
+        if b"import" not in source or not _IMPORT_KEYWORD_RE.search(source):
+            return imports, None
+
+        try:
+            tree = compile(
+                source,
+                file_path,
+                "exec",
+                flags=ast.PyCF_ONLY_AST,
+                dont_inherit=True,
+            )
+        except SyntaxError as e:
+            return imports, f"Syntax error in {file_path}: {e}"
+
+        for node in _iter_import_nodes(tree):
             if isinstance(node, ast.Import):
                 for alias in node.names:
                     # Get the top-level package name
                     package = alias.name.split(".")[0]
                     imports.add(package)
 
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    # Get the top-level package name
-                    package = node.module.split(".")[0]
-                    imports.add(package)
+            elif node.module:
+                # Get the top-level package name
+                package = node.module.split(".")[0]
+                imports.add(package)
 
     except Exception as e:
-        logger.warning(f"Error reading {file_path}: {e}")
+        return imports, f"Error reading {file_path}: {e}"
 
-    return imports
+    return imports, None
 
 
 def find_python_files(directory: str = ".") -> List[str]:
@@ -99,46 +306,104 @@ def find_python_files(directory: str = ".") -> List[str]:
         List of paths to Python (.py) files, excluding common build/cache directories
     """
     python_files = []
+    stack = [directory]
 
-    # Skip common directories that shouldn't be scanned
-    skip_dirs = {
-        ".git",
-        ".svn",
-        ".hg",  # VCS
-        "__pycache__",
-        ".pytest_cache",  # Cache
-        ".venv",
-        "venv",
-        "env",  # Virtual environments
-        "node_modules",  # JS dependencies
-        ".tox",
-        ".mypy_cache",  # Tools
-        "build",
-        "dist",
-        ".eggs",  # Build artifacts
-    }
+    # Walk with scandir directly: entry types come from the directory
+    # listing, so no per-file stat() is needed
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        # Like os.walk, don't follow directory symlinks
+                        if (
+                            entry.name not in _SKIP_DIRS
+                            and not entry.is_symlink()
+                        ):
+                            stack.append(entry.path)
+                    elif entry.name.endswith(".py"):
+                        python_files.append(entry.path)
+        except OSError:
+            continue
+
+    return python_files
 
-    for root, dirs, files in os.walk(directory):
-        # Remove skip directories from dirs list
-        dirs[:] = [d for d in dirs if d not in skip_dirs]
 
-        for file in files:
-            if file.endswith(".py"):
-                python_files.append(os.path.join(root, file))
+def _pool_context() -> "BaseContext":
+    """Pick a start method that never forks the (threaded) CLI process.
 
-    return python_files
+    main() scans installed packages in a background thread, and forking a
+    multithreaded process can deadlock the children on inherited locks.
+
+    Returns:
+        A forkserver context where available, otherwise spawn
+    """
+    import multiprocessing
 
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
 
-def analyze_project_imports(directory: str = ".") -> Set[str]:
+
+def _extract_imports_from_files(
+    python_files: List[str], parallel: bool = False
+) -> List[Set[str]]:
+    """Extract imports from many files, in parallel when worthwhile.
+
+    Parsing is CPU-bound and independent per file, so with ``parallel``
+    large projects are spread over a process pool; small projects (or
+    single-CPU machines) are parsed serially to avoid the pool start-up
+    cost. Warnings from the workers are logged here, in this process.
+
+    Args:
+        python_files: Paths to the Python files to analyze
+        parallel: Allow a process pool (default: False)
+
+    Returns:
+        List of import sets, in the same order as ``python_files``
+    """
+    results: Optional[List[Tuple[Set[str], Optional[str]]]] = None
+    cpu_count = os.cpu_count() or 1
+    if parallel and cpu_count > 1 and len(python_files) >= _PARALLEL_MIN_FILES:
+        # Imported here; only large parallel runs need the pool machinery
+        from concurrent.futures import ProcessPoolExecutor
+        from concurrent.futures.process import BrokenProcessPool
+
+        try:
+            with ProcessPoolExecutor(mp_context=_pool_context()) as executor:
+                results = list(
+                    executor.map(_scan_imports, python_files, chunksize=16)
+                )
+        except (OSError, NotImplementedError, BrokenProcessPool) as e:
+            logger.warning(
+                f"Parallel analysis unavailable, running serially: {e}"
+            )
+
+    if results is None:
+        results = [_scan_imports(path) for path in python_files]
+
+    for _, warning in results:
+        if warning:
+            logger.warning(warning)
+    return [imports for imports, _ in results]
+
+
+def analyze_project_imports(
+    directory: str = ".", parallel: bool = False
+) -> Set[str]:
     """Analyze all Python files in project to find imported packages.
 
     Args:
         directory: Root directory to analyze (default: current directory)
+        parallel: Parse large projects in a process pool (default: False).
+            The pool's spawn/forkserver workers re-import the caller's
+            ``__main__`` module, so only enable this from scripts with an
+            ``if __name__ == "__main__":`` guard, like the midna CLI
 
     Returns:
         Set of third-party package names found in imports
     """
-    logger = logging.getLogger("midna")
     logger.info(f"Analyzing Python files in: {directory}")
 
     all_imports = set()
@@ -146,10 +411,12 @@ def analyze_project_imports(directory: str = ".") -> Set[str]:
 
     logger.info(f"Found {len(python_files)} Python files to analyze")
 
-    for file_path in python_files:
-        imports = extract_imports_from_file(file_path)
+    debug = logger.isEnabledFor(logging.DEBUG)
+    for file_path, imports in zip(
+        python_files, _extract_imports_from_files(python_files, parallel)
+    ):
         all_imports.update(imports)
-        if imports:
+        if debug and imports:
             logger.debug(f"Imports from {file_path}: {imports}")
 
     # Filter out standard library modules
@@ -170,97 +437,15 @@ def filter_standard_library(imports: Set[str]) -> Set[str]:
     Returns:
         Set of non-stdlib package names
     """
-
-    # Common standard library modules (not exhaustive but covers most)
-    stdlib_modules = {
-        "os",
-        "sys",
-        "json",
-        "re",
-        "math",
-        "random",
-        "datetime",
-        "time",
-        "pathlib",
-        "collections",
-        "itertools",
-        "functools",
-        "operator",
-        "typing",
-        "dataclasses",
-        "enum",
-        "abc",
-        "contextlib",
-        "logging",
-        "argparse",
-        "configparser",
-        "subprocess",
-        "shutil",
-        "tempfile",
-        "glob",
-        "fnmatch",
-        "linecache",
-        "pickle",
-        "copy",
-        "pprint",
-        "textwrap",
-        "string",
-        "io",
-        "codecs",
-        "locale",
-        "calendar",
-        "hashlib",
-        "hmac",
-        "secrets",
-        "uuid",
-        "urllib",
-        "http",
-        "email",
-        "html",
-        "xml",
-        "csv",
-        "sqlite3",
-        "zlib",
-        "gzip",
-        "bz2",
-        "lzma",
-        "zipfile",
-        "tarfile",
-        "threading",
-        "multiprocessing",
-        "concurrent",
-        "queue",
-        "socket",
-        "ssl",
-        "asyncio",
-        "unittest",
-        "doctest",
-        "trace",
-        "pdb",
-        "profile",
-        "warnings",
-        "inspect",
-        "dis",
-        "importlib",
-        "pkgutil",
-        "platform",
-        "ctypes",
-        "struct",
-        "array",
-        "weakref",
-        "gc",
-        "types",
-    }
-
     return {
         imp
         for imp in imports
-        if imp not in stdlib_modules and not imp.startswith("_")
+        if imp not in _STDLIB_MODULES and not imp.startswith("_")
     }
 
 
 def auto_discover_requirements(
-    directory: str = ".",
+    directory: str = ".", parallel: bool = False
 ) -> Tuple[List[Tuple[str, str]], str]:
     """Auto-discover requirements using multiple strategies.
 
@@ -271,28 +456,32 @@ def auto_discover_requirements(
 
     Args:
         directory: Root directory to analyze (default: current directory)
+        parallel: Allow a process pool for import analysis; see
+            ``analyze_project_imports`` (default: False)
 
     Returns:
         Tuple of (packages_list, discovery_method) where packages_list contains
         tuples of (package_name, version) for third-party packages
     """
-    logger = logging.getLogger("midna")
     logger.info("Starting auto-discovery of requirements...")
 
     # Strategy 1: Look for existing requirements files
     req_files = find_requirements_files(directory)
 
-    if req_files:
-        # Prefer requirements.txt if available
-        preferred_file = None
-        for file_path in req_files:
-            if "requirements.txt" in os.path.basename(file_path):
-                preferred_file = file_path
-                break
-
-        if not preferred_file:
-            preferred_file = req_files[0]
+    # find_requirements_files lists requirements.txt, then other
+    # requirements*.txt files, then pyproject.toml; setup.py, Pipfile and
+    # conda files are skipped since read_requirements can't parse them
+    preferred_file = next(
+        (
+            file_path
+            for file_path in req_files
+            if os.path.basename(file_path) == "pyproject.toml"
+            or file_path.endswith(".txt")
+        ),
+        None,
+    )
 
+    if preferred_file:
         logger.info(f"Using requirements file: {preferred_file}")
 
         # Import here to avoid circular imports
@@ -306,7 +495,7 @@ def auto_discover_requirements(
 
     # Strategy 2: Analyze Python files for imports
     logger.info("No requirements files found, analyzing Python imports...")
-    discovered_imports = analyze_project_imports(directory)
+    discovered_imports = analyze_project_imports(directory, parallel)
 
     if discovered_imports:
         # Classify the discovered packages
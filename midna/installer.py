@@ -4,6 +4,8 @@ import logging
 import subprocess
 from typing import List
 
+logger = logging.getLogger("midna")
+
 
 def install_packages(packages: List[str], dry_run: bool = False) -> int:
     """Install packages using pip.
@@ -15,8 +17,6 @@ def install_packages(packages: List[str], dry_run: bool = False) -> int:
     Returns:
         Exit code (0 for success, 1 for failure)
     """
-    logger = logging.getLogger("midna")
-
     if not packages:
         print("No packages to install.")
         logger.info("No packages to install")
@@ -24,8 +24,7 @@ def install_packages(packages: List[str], dry_run: bool = False) -> int:
 
     if dry_run:
         print("DRY RUN: Would install the following packages:")
-        for package in packages:
-            print(f"  - {package}")
+        print("\n".join(f"  - {package}" for package in packages))
         logger.info(
             f"Dry run completed. Would install {len(packages)} packages"
         )
@@ -39,9 +38,8 @@ def install_packages(packages: List[str], dry_run: bool = False) -> int:
     logger.debug(f"Running command: {' '.join(cmd)}")
 
     try:
-        result = subprocess.run(
-            cmd, check=True, capture_output=True, shell=False
-        )
+        # Inherit stdio so pip's progress and errors reach the user directly
+        result = subprocess.run(cmd, check=True, shell=False)
         logger.info("Installation completed successfully")
         print("Installation completed successfully!")
         return result.returncode
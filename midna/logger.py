@@ -1,6 +1,7 @@
 """Logging configuration for Midna"""
 
 import logging
+import logging.handlers
 from pathlib import Path
 
 
@@ -17,7 +18,14 @@ def setup_logging(
         Configured logger instance
     """
     logger = logging.getLogger("midna")
-    logger.setLevel(logging.DEBUG)
+    # Only go as low as an attached handler needs, so the isEnabledFor()
+    # guards around per-line debug messages can skip formatting them
+    if enable_file_logging:
+        logger.setLevel(logging.DEBUG)
+    elif verbose:
+        logger.setLevel(logging.INFO)
+    else:
+        logger.setLevel(logging.WARNING)
     logger.handlers.clear()
 
     # File handler only if explicitly requested
@@ -26,7 +34,14 @@ def setup_logging(
         log_dir.mkdir(parents=True, exist_ok=True)
         log_file = log_dir / "midna.log"
 
-        file_handler = logging.FileHandler(log_file)
+        # Opened on the first record and capped at a few rotated files
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_file,
+            maxBytes=1_000_000,
+            backupCount=3,
+            encoding="utf-8",
+            delay=True,
+        )
         file_handler.setLevel(logging.DEBUG)
         file_formatter = logging.Formatter(
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
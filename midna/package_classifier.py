@@ -1,21 +1,22 @@
 """Package classification for Midna"""
 
+import functools
 import importlib.util
 import sys
 from pathlib import Path
-from typing import List, Set, Tuple
+from typing import Dict, FrozenSet, List, Set, Tuple
 
-try:
-    from importlib.metadata import distribution
-except ImportError:
-    from importlib_metadata import distribution  # type: ignore
+from .checker import get_installed_version
 
-# Standard library modules in Python 3
-STDLIB_MODULES = {
+# Standard library modules in Python 3; Python < 3.10 lacks
+# sys.stdlib_module_names, so approximate from the modules imported so far
+STDLIB_MODULES: FrozenSet[str] = getattr(
+    sys, "stdlib_module_names", None
+) or frozenset(
     name.split(".")[0]
     for name in list(sys.builtin_module_names) + list(sys.modules)
     if name.split(".")[0] not in {"test", "pip", "setuptools"}
-}
+)
 
 # Common test and internal modules to ignore
 IGNORED_MODULES = {
@@ -50,9 +51,13 @@ def is_stdlib_package(package_name: str) -> bool:
     return False
 
 
+@functools.lru_cache(maxsize=None)
 def is_project_package(package_name: str, project_root: str) -> bool:
     """Check if a package is part of the current project.
 
+    Results are cached per (package_name, project_root); pass an absolute
+    project_root so cached answers don't depend on the working directory.
+
     Args:
         package_name: Name of the package to check
         project_root: Root directory of the project
@@ -85,19 +90,20 @@ def get_package_version(package_name: str) -> str:
     Returns:
         Version string if found, empty string otherwise
     """
+    # Try the installed distributions first, sharing the checker's scan
+    version = get_installed_version(package_name)
+    if version:
+        return version
+
     try:
-        # Try getting version from importlib.metadata first
-        return str(distribution(package_name).version)
-    except ImportError:
-        try:
-            # Try importing the package and checking __version__
-            module = importlib.import_module(package_name)
-            if hasattr(module, "__version__"):
-                return str(module.__version__)
-            elif hasattr(module, "VERSION"):
-                return str(module.VERSION)
-        except (ImportError, AttributeError):
-            pass
+        # Try importing the package and checking __version__
+        module = importlib.import_module(package_name)
+        if hasattr(module, "__version__"):
+            return str(module.__version__)
+        elif hasattr(module, "VERSION"):
+            return str(module.VERSION)
+    except (ImportError, AttributeError):
+        pass
     return ""
 
 
@@ -118,7 +124,12 @@ def classify_packages(
     """
     stdlib_packages: List[str] = []
     project_packages: List[str] = []
-    third_party_packages: List[Tuple[str, str]] = []
+    # Keyed by lowercased top-level name: "requests.adapters" and
+    # "Requests" collapse to one entry, looked up only once
+    third_party_versions: Dict[str, str] = {}
+
+    # Resolve once here rather than once per package
+    project_root = str(Path(project_root).resolve())
 
     for package in packages:
         # Skip empty or invalid package names
@@ -132,13 +143,14 @@ def classify_packages(
             stdlib_packages.append(package)
         elif is_project_package(base_package, project_root):
             project_packages.append(package)
-        else:
-            version = get_package_version(base_package)
+        elif base_package not in third_party_versions:
             # Include all detected third-party packages, even if not installed
-            third_party_packages.append((base_package, version))
+            third_party_versions[base_package] = get_package_version(
+                base_package
+            )
+
+    stdlib_packages.sort()
+    project_packages.sort()
+    third_party_packages = sorted(third_party_versions.items())
 
-    return (
-        sorted(set(stdlib_packages)),  # Remove duplicates
-        sorted(set(project_packages)),
-        sorted(set((p, v) for p, v in third_party_packages)),
-    )
+    return stdlib_packages, project_packages, third_party_packages
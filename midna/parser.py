@@ -2,13 +2,26 @@
 
 import logging
 import os
+import re
 import sys
-from typing import List
+from typing import Dict, Iterable, List
 
-if sys.version_info >= (3, 11):
-    from tomllib import load as _toml_load
-else:
-    from tomli import load as _toml_load
+logger = logging.getLogger("midna")
+
+# Leading package name with optional extras, e.g. "package[extra]"
+_PACKAGE_NAME_RE = re.compile(r"^([a-zA-Z0-9_-]+(?:\[[a-zA-Z0-9_,-]+\])?)")
+
+# Characters that start a version specifier (>=, <=, ==, !=, >, <, ~=)
+_VERSION_SEPARATOR_RE = re.compile(r"[<>=!~]")
+
+# Version operators that mark a TOML dependency as a real requirement
+_VERSIONED_RE = re.compile(r"[<>]|==")
+
+# Build tools kept from TOML files even without a version pin
+_BASIC_PACKAGES = frozenset(("pip", "setuptools", "wheel"))
+
+# PEP 503: runs of "-", "_" and "." are equivalent in distribution names
+_NAME_SEPARATORS_RE = re.compile(r"[-_.]+")
 
 
 def read_requirements(file_path: str) -> List[str]:
@@ -23,7 +36,6 @@ def read_requirements(file_path: str) -> List[str]:
     Raises:
         FileNotFoundError: If the requirements file doesn't exist
     """
-    logger = logging.getLogger("midna")
     logger.info(f"Reading requirements from: {file_path}")
 
     if not os.path.exists(file_path):
@@ -32,62 +44,86 @@ def read_requirements(file_path: str) -> List[str]:
 
     # Handle TOML files
     if file_path.endswith(".toml"):
-        try:
-            return parse_toml_requirements(file_path)
-        except ImportError as e:
-            logger.warning(f"Failed to read {file_path}: {e}")
-            # Fall back to treating it as a regular text file
+        return parse_toml_requirements(file_path)
 
-    # Handle regular requirements files
+    # Handle regular requirements files, one line at a time
     try:
         with open(file_path, "r", encoding="utf-8") as f:
-            lines = f.readlines()
+            packages = _parse_stream(f, file_path)
     except Exception as e:
         logger.error(f"Error reading requirements file: {e}")
         raise
 
+    logger.info(f"Found {len(packages)} packages in {file_path}")
+    return packages
+
+
+def _parse_stream(lines: Iterable[str], file_path: str = "") -> List[str]:
+    """Parse requirements-file lines into package specifications.
+
+    Args:
+        lines: Lines of a requirements file, e.g. an open text file
+        file_path: Path the lines came from; ``-r`` includes are resolved
+            relative to it (default: current directory)
+
+    Returns:
+        List of package specifications
+    """
     packages = []
-    for line_num, line in enumerate(lines, 1):
-        line = line.strip()
+    debug = logger.isEnabledFor(logging.DEBUG)
+    for line_num, raw_line in enumerate(lines, 1):
+        line = raw_line.strip()
 
         # Skip empty lines and comments
-        if not line or line.startswith("#"):
+        if not line or line[0] == "#":
             continue
 
-        # Handle -r includes (recursive requirements)
-        if line.startswith("-r "):
-            include_file = line[3:].strip()
-            if not os.path.isabs(include_file):
-                # Make relative path relative to current requirements file
-                include_file = os.path.join(
-                    os.path.dirname(file_path), include_file
+        if line[0] == "-":
+            # Handle -r includes (recursive requirements)
+            if line.startswith("-r "):
+                packages.extend(
+                    _read_included_requirements(line[3:], file_path)
                 )
-
-            logger.info(f"Found include: {include_file}")
-            try:
-                included_packages = read_requirements(include_file)
-                packages.extend(included_packages)
-            except FileNotFoundError:
-                logger.warning(f"Included file not found: {include_file}")
-                msg = (
-                    f"WARNING: Included requirements file not found: "
-                    f"{include_file}"
-                )
-                print(msg)
-            continue
-
-        # Skip other pip options
-        if line.startswith("-"):
-            logger.debug(f"Skipping pip option at line {line_num}: {line}")
+            else:
+                # Skip other pip options
+                if debug:
+                    logger.debug(
+                        f"Skipping pip option at line {line_num}: {line}"
+                    )
             continue
 
         packages.append(line)
-        logger.debug(f"Added package: {line}")
+        if debug:
+            logger.debug(f"Added package: {line}")
 
-    logger.info(f"Found {len(packages)} packages in {file_path}")
     return packages
 
 
+def _read_included_requirements(include: str, file_path: str) -> List[str]:
+    """Read a requirements file included with ``-r`` from another one.
+
+    Args:
+        include: Included path as written after ``-r``
+        file_path: Path of the including requirements file
+
+    Returns:
+        List of package specifications, empty if the file doesn't exist
+    """
+    include_file = include.strip()
+    if not os.path.isabs(include_file):
+        # Make relative path relative to current requirements file
+        include_file = os.path.join(os.path.dirname(file_path), include_file)
+
+    logger.info(f"Found include: {include_file}")
+    try:
+        return read_requirements(include_file)
+    except FileNotFoundError:
+        logger.warning(f"Included file not found: {include_file}")
+        msg = f"WARNING: Included requirements file not found: {include_file}"
+        print(msg)
+        return []
+
+
 def parse_toml_requirements(file_path: str) -> List[str]:
     """Parse requirements from a TOML file (pyproject.toml).
 
@@ -99,10 +135,21 @@ def parse_toml_requirements(file_path: str) -> List[str]:
 
     Raises:
         FileNotFoundError: If file doesn't exist
+        ImportError: If tomli is missing on Python < 3.11
         Exception: If TOML parsing fails
     """
-    """Parse requirements from a TOML file (pyproject.toml)"""
-    logger = logging.getLogger("midna")
+    # Imported here so plain requirements.txt runs never load a TOML parser
+    if sys.version_info >= (3, 11):
+        from tomllib import load as _toml_load
+    else:
+        try:
+            from tomli import load as _toml_load
+        except ImportError as e:
+            logger.error("tomli is required to read TOML files")
+            raise ImportError(
+                "Reading TOML requirements on Python < 3.11 requires the "
+                "tomli package (pip install tomli)"
+            ) from e
 
     with open(file_path, "rb") as f:
         try:
@@ -111,39 +158,40 @@ def parse_toml_requirements(file_path: str) -> List[str]:
             logger.error(f"Error parsing TOML file: {e}")
             raise
 
-    packages = []
+    # Insertion-ordered dict, so a requirement listed in several groups
+    # (e.g. setuptools in both extras and build-system) is kept once
+    packages: Dict[str, None] = {}
 
     # Get project dependencies
     project_data = toml_data.get("project", {})
     dependencies = project_data.get("dependencies", [])
     if dependencies:
         if isinstance(dependencies, list):
-            packages.extend(dependencies)
+            packages.update(dict.fromkeys(dependencies))
 
     # Get optional dependencies
     optional_deps = project_data.get("optional-dependencies", {})
     for group, deps in optional_deps.items():
         if isinstance(deps, list):
-            packages.extend(deps)
+            packages.update(dict.fromkeys(deps))
 
     # Get build system requirements
     build_system = toml_data.get("build-system", {})
     build_requires = build_system.get("requires", [])
     if build_requires:
         if isinstance(build_requires, list):
-            packages.extend(build_requires)
+            packages.update(dict.fromkeys(build_requires))
 
     # Filter out any non-package entries (like keywords)
     # Keep basic requirements (pip, setuptools, wheel) and versioned packages
-    packages = [
+    result = [
         pkg
         for pkg in packages
-        if pkg in ["pip", "setuptools", "wheel"]
-        or any(op in pkg for op in [">=", "==", "<=", "<", ">"])
+        if pkg in _BASIC_PACKAGES or _VERSIONED_RE.search(pkg)
     ]
 
-    logger.info(f"Found {len(packages)} packages in TOML file")
-    return packages
+    logger.info(f"Found {len(result)} packages in TOML file")
+    return result
 
 
 def parse_package_name(package_spec: str) -> str:
@@ -156,23 +204,32 @@ def parse_package_name(package_spec: str) -> str:
         Package name without version specifiers
     """
     """Extract package name from package specification"""
-    import re
-
     # Remove comments
     if "#" in package_spec:
         package_spec = package_spec.split("#")[0].strip()
 
     # Extract package name (everything before version specifiers)
     # Handle cases like: package>=1.0, package==1.0, package[extra]>=1.0
-    pattern = r"^([a-zA-Z0-9_-]+(?:\[[a-zA-Z0-9_,-]+\])?)"
-    match = re.match(pattern, package_spec)
+    match = _PACKAGE_NAME_RE.match(package_spec)
 
     if match:
         return match.group(1).split("[")[0]  # Remove extras
 
-    # Fallback: split on common version specifiers
-    for separator in [">=", "<=", "==", "!=", ">", "<", "~="]:
-        if separator in package_spec:
-            return package_spec.split(separator)[0].strip()
+    # Fallback: cut at the earliest version specifier character
+    separator = _VERSION_SEPARATOR_RE.search(package_spec)
+    if separator:
+        return package_spec[: separator.start()].strip()
 
     return package_spec.strip()
+
+
+def normalize_package_name(name: str) -> str:
+    """Normalize a distribution name for comparison (PEP 503).
+
+    Args:
+        name: Distribution name (e.g., 'Typing_Extensions')
+
+    Returns:
+        Lowercase name with separator runs collapsed to '-'
+    """
+    return _NAME_SEPARATORS_RE.sub("-", name).lower()
@@ -2,57 +2,77 @@
 
 import logging
 import subprocess
-from typing import List, Tuple
+from typing import List, Optional, Tuple, Union
 
-from .parser import parse_package_name, read_requirements
+from .checker import get_installed_packages
+from .parser import (
+    normalize_package_name,
+    parse_package_name,
+    read_requirements,
+)
 
+logger = logging.getLogger("midna")
 
-def uninstall_packages(requirements_file: str, dry_run: bool = False) -> int:
-    """Uninstall packages from a requirements file using pip.
+
+def uninstall_packages(
+    requirements: Union[str, List[str]], dry_run: bool = False
+) -> int:
+    """Uninstall packages from a requirements file or list using pip.
 
     Args:
-        requirements_file: Path to requirements file
+        requirements: Path to requirements file, or list of package
+            specifications
         dry_run: If True, only preview without uninstalling (default: False)
 
     Returns:
         Exit code (0 for success, non-zero for errors)
     """
-    logger = logging.getLogger("midna")
-
-    try:
-        packages = read_requirements(requirements_file)
-    except FileNotFoundError:
-        logger.error(f"Requirements file not found: {requirements_file}")
-        print(f"ERROR: Requirements file not found: {requirements_file}")
-        return 1
+    if isinstance(requirements, str):
+        try:
+            packages = read_requirements(requirements)
+        except FileNotFoundError:
+            logger.error(f"Requirements file not found: {requirements}")
+            print(f"ERROR: Requirements file not found: {requirements}")
+            return 1
+    else:
+        packages = requirements
 
     # Only uninstall packages that are actually installed
-    found_packages, _ = _check_package_list_to_uninstall(packages)
-    return _uninstall_package_list(found_packages, dry_run)
+    found, _ = _check_package_list_to_uninstall(packages)
+    return _uninstall_package_list(
+        [spec for spec, _ in found],
+        dry_run,
+        package_names=[name for _, name in found],
+    )
 
 
-def _uninstall_package_list(packages: List[str], dry_run: bool = False) -> int:
+def _uninstall_package_list(
+    packages: List[str],
+    dry_run: bool = False,
+    package_names: Optional[List[str]] = None,
+) -> int:
     """Internal function to uninstall a list of packages.
 
     Args:
         packages: List of package names to uninstall
         dry_run: If True, only preview without uninstalling (default: False)
+        package_names: Names already parsed from ``packages``, if known
 
     Returns:
         Exit code (0 for success, non-zero for errors)
     """
-    logger = logging.getLogger("midna")
-
     if not packages:
         print("No packages to uninstall.")
         logger.info("No packages to uninstall")
         return 0
 
+    # Extract just the package names (without version specifiers)
+    if package_names is None:
+        package_names = [parse_package_name(pkg) for pkg in packages]
+
     if dry_run:
         print("DRY RUN: Would uninstall the following packages:")
-        for package in packages:
-            package_name = parse_package_name(package)
-            print(f"  - {package_name}")
+        print("\n".join(f"  - {name}" for name in package_names))
         logger.info(
             f"Dry run completed. Would uninstall {len(packages)} packages"
         )
@@ -61,17 +81,13 @@ def _uninstall_package_list(packages: List[str], dry_run: bool = False) -> int:
     print(f"Uninstalling {len(packages)} packages...")
     logger.info(f"Starting uninstallation of {len(packages)} packages")
 
-    # Extract just the package names (without version specifiers)
-    package_names = [parse_package_name(pkg) for pkg in packages]
-
     # Uninstall packages
     cmd = ["pip", "uninstall", "-y"] + package_names
     logger.debug(f"Running command: {' '.join(cmd)}")
 
     try:
-        result = subprocess.run(
-            cmd, check=True, capture_output=True, shell=False
-        )
+        # Inherit stdio so pip's progress and errors reach the user directly
+        result = subprocess.run(cmd, check=True, shell=False)
         logger.info("Uninstallation completed successfully")
         print("Uninstallation completed successfully!")
         return result.returncode
@@ -88,12 +104,13 @@ def _uninstall_package_list(packages: List[str], dry_run: bool = False) -> int:
 
 
 def check_packages_to_uninstall(
-    requirements_file: str,
+    requirements: Union[str, List[str]],
 ) -> Tuple[List[str], List[str]]:
-    """Check which packages from a requirements file are installed.
+    """Check which packages from a requirements file or list are installed.
 
     Args:
-        requirements_file: Path to requirements file
+        requirements: Path to requirements file, or list of package
+            specifications
 
     Returns:
         Tuple of two lists: (installed_packages, not_installed_packages)
@@ -101,63 +118,49 @@ def check_packages_to_uninstall(
     Raises:
         FileNotFoundError: If the requirements file doesn't exist
     """
-    logger = logging.getLogger("midna")
     logger.info("Checking packages for uninstallation...")
 
-    try:
-        packages = read_requirements(requirements_file)
-    except FileNotFoundError:
-        logger.error(f"Requirements file not found: {requirements_file}")
-        raise
+    if isinstance(requirements, str):
+        try:
+            packages = read_requirements(requirements)
+        except FileNotFoundError:
+            logger.error(f"Requirements file not found: {requirements}")
+            raise
+    else:
+        packages = requirements
 
-    return _check_package_list_to_uninstall(packages)
+    found, not_found_packages = _check_package_list_to_uninstall(packages)
+    return [spec for spec, _ in found], not_found_packages
 
 
 def _check_package_list_to_uninstall(
     packages: List[str],
-) -> Tuple[List[str], List[str]]:
-    """Check which packages in a list are installed."""
-    logger = logging.getLogger("midna")
-
-    try:
-        # Get list of installed packages
-        result = subprocess.run(
-            ["pip", "list", "--format=freeze"],
-            capture_output=True,
-            text=True,
-            check=True,
-            shell=False,
-        )
-
-        installed_raw = (
-            result.stdout.strip().split("\n") if result.stdout.strip() else []
-        )
-        installed_packages = set()
+) -> Tuple[List[Tuple[str, str]], List[str]]:
+    """Check which packages in a list are installed.
 
-        for package in installed_raw:
-            if "==" in package:
-                name = package.split("==")[0].lower()
-                installed_packages.add(name)
-
-        logger.debug(f"Found {len(installed_packages)} installed packages")
-
-    except subprocess.CalledProcessError as e:
-        logger.error(f"Failed to get installed packages: {e}")
-        print("ERROR: Failed to check installed packages")
-        raise
+    Returns:
+        Tuple of (found, not_found): found holds (specification, name)
+        pairs so callers can reuse the parsed names
+    """
+    # Share the checker's cached in-process scan instead of running pip
+    installed_packages = get_installed_packages()
+    logger.debug(f"Found {len(installed_packages)} installed packages")
 
-    found_packages = []
-    not_found_packages = []
+    found_packages: List[Tuple[str, str]] = []
+    not_found_packages: List[str] = []
 
+    debug = logger.isEnabledFor(logging.DEBUG)
     for package in packages:
-        package_name = parse_package_name(package).lower()
+        package_name = parse_package_name(package)
 
-        if package_name in installed_packages:
-            found_packages.append(package)
-            logger.debug(f"Found for uninstall: {package}")
+        if normalize_package_name(package_name) in installed_packages:
+            found_packages.append((package, package_name))
+            if debug:
+                logger.debug(f"Found for uninstall: {package}")
         else:
             not_found_packages.append(package)
-            logger.debug(f"Not installed: {package}")
+            if debug:
+                logger.debug(f"Not installed: {package}")
 
     logger.info(
         f"Packages found: {len(found_packages)}, "